@@ -6,16 +6,46 @@ including inputs, constraints, routing hints, and output shaping rules.
 """
 
 import json
-import uuid
+import secrets
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 from copy import deepcopy
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+from .executor import Executor
+from .pruner import Pruner
+from .router import Router
+
+# Shared encoders: the compact one runs on the C accelerator, which the
+# stdlib only uses when no indent is requested
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_PRETTY_ENCODER = json.JSONEncoder(indent=2)
+
+# Maps every digit to "9" so a run of 19 digits can be found with one `in`
+_DIGITS = str.maketrans("0123456789", "9999999999")
+_LONG_DIGITS = "9" * 19
+
+_UTC = timezone.utc
+
+# Stateless helpers shared by every Context unless overridden per instance
+_EXECUTOR = Executor()
+_PRUNER = Pruner()
+_ROUTER = Router()
+
 
 class ContextInput:
     """Represents a single input with metadata."""
     
+    __slots__ = ("data", "relevance", "tokens")
+    
     def __init__(self, data: Any, relevance: float = 1.0, tokens: Optional[int] = None):
+        # Pruning relies on running token totals never decreasing
+        if tokens is not None and tokens < 0:
+            raise ValueError("tokens must not be negative")
         self.data = data
         self.relevance = relevance
         self.tokens = tokens or self._estimate_tokens(data)
@@ -24,11 +54,11 @@ class ContextInput:
     def _estimate_tokens(data: Any) -> int:
         """Rough token estimation (4 chars per token)."""
         if isinstance(data, str):
-            return len(data) // 4
+            return len(data) >> 2
         elif isinstance(data, (dict, list)):
-            return len(json.dumps(data)) // 4
+            return len(json.dumps(data)) >> 2
         else:
-            return len(str(data)) // 4
+            return len(str(data)) >> 2
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
@@ -69,6 +99,12 @@ class Context:
         >>> result = ctx.execute(task="Extract key themes")
     """
     
+    __slots__ = (
+        "id", "intent", "category", "inputs", "constraints", "routing",
+        "output", "metadata", "parent_id", "created_at",
+        "_executor", "_pruner", "_router", "__weakref__"
+    )
+    
     def __init__(
         self,
         intent: str,
@@ -91,9 +127,10 @@ class Context:
             output: Output shaping (format, schema)
             metadata: Arbitrary metadata
             parent_id: Parent context ID if extended
-            context_id: Explicit context ID (auto-generated if not provided)
+            context_id: Explicit context ID (random 32-character hex string
+                if not provided)
         """
-        self.id = context_id or str(uuid.uuid4())
+        self.id = context_id or secrets.token_hex(16)
         self.intent = intent
         self.category = category
         self.inputs: List[ContextInput] = []
@@ -102,7 +139,7 @@ class Context:
         self.output = output or {}
         self.metadata = metadata or {}
         self.parent_id = parent_id
-        self.created_at = datetime.now(timezone.utc)
+        self.created_at = datetime.now(_UTC)
         self._executor = None
         self._pruner = None
         self._router = None
@@ -127,6 +164,50 @@ class Context:
         self.inputs.append(ContextInput(data, relevance, tokens))
         return self
     
+    def add_inputs(
+        self,
+        items: Iterable[Any],
+        relevance: Union[float, Sequence[float]] = 1.0,
+        tokens: Optional[Sequence[Optional[int]]] = None
+    ) -> "Context":
+        """
+        Add several inputs in one call.
+        
+        Token counts for a batch of strings are computed in one pass over
+        their lengths; other data is estimated per item as in add_input().
+        
+        Args:
+            items: Input data items
+            relevance: Relevance score (0.0 to 1.0) for every item, or one
+                score per item
+            tokens: Token count per item (None entries are auto-estimated)
+        
+        Returns:
+            Self for chaining
+        
+        Raises:
+            ValueError: If per-item relevance or tokens do not match items
+        """
+        items = list(items)
+        if isinstance(relevance, (int, float)):
+            relevances = [relevance] * len(items)
+        else:
+            relevances = list(relevance)
+        if len(relevances) != len(items):
+            raise ValueError("relevance must have one score per item")
+        
+        if tokens is None:
+            if all(isinstance(item, str) for item in items):
+                tokens = [length >> 2 for length in map(len, items)]
+            else:
+                tokens = [None] * len(items)
+        elif len(tokens) != len(items):
+            raise ValueError("tokens must have one count per item")
+        
+        # Build the batch first so an invalid item leaves inputs untouched
+        self.inputs.extend(list(map(ContextInput, items, relevances, tokens)))
+        return self
+    
     def prune(
         self,
         max_tokens: Optional[int] = None,
@@ -142,12 +223,9 @@ class Context:
         Returns:
             Self for chaining
         """
-        from .pruner import Pruner
-        if self._pruner is None:
-            self._pruner = Pruner()
-        
+        pruner = self._pruner or _PRUNER
         max_tok = max_tokens or self.constraints.get("max_tokens")
-        self.inputs = self._pruner.prune(
+        self.inputs = pruner.prune(
             self.inputs,
             max_tokens=max_tok,
             relevance_threshold=relevance_threshold
@@ -171,12 +249,9 @@ class Context:
         Returns:
             Self for chaining
         """
-        from .router import Router
-        if self._router is None:
-            self._router = Router()
-        
         # Apply routing logic
-        routing_config = self._router.route(
+        router = self._router or _ROUTER
+        routing_config = router.route(
             current_routing=self.routing,
             model=model,
             provider=provider,
@@ -204,17 +279,16 @@ class Context:
         Returns:
             Execution response with result and metadata
         """
-        from .executor import Executor
-        if self._executor is None:
-            self._executor = Executor()
-        
         request = {
             "task": task,
             "system_prompt": system_prompt,
             "override_routing": override_routing
         }
         
-        return self._executor.execute(self, request, api_key=api_key)
+        executor = self._executor or _EXECUTOR
+        return executor.execute(
+            self, request, api_key=api_key, router=self._router or _ROUTER
+        )
     
     def extend(
         self,
@@ -224,6 +298,11 @@ class Context:
         """
         Create a child context extending this one.
         
+        Configuration dicts and the input list are copied shallowly: the
+        child can add, remove or replace entries without touching the
+        parent, but nested values and ContextInput objects are shared.
+        Call fork_inputs() on the child before mutating input data in place.
+        
         Args:
             intent: New intent (inherits parent if not provided)
             **kwargs: Additional context parameters
@@ -234,15 +313,15 @@ class Context:
         child = Context(
             intent=intent or self.intent,
             category=kwargs.get("category", self.category),
-            constraints=deepcopy(self.constraints),
-            routing=deepcopy(self.routing),
-            output=deepcopy(self.output),
-            metadata=deepcopy(self.metadata),
+            constraints=self.constraints.copy(),
+            routing=self.routing.copy(),
+            output=self.output.copy(),
+            metadata=self.metadata.copy(),
             parent_id=self.id
         )
         
         # Inherit inputs
-        child.inputs = deepcopy(self.inputs)
+        child.inputs = self.inputs.copy()
         
         # Update with any overrides
         for key, value in kwargs.items():
@@ -255,6 +334,8 @@ class Context:
         """
         Merge another context into a new context.
         
+        Like extend(), configuration dicts and inputs are copied shallowly.
+        
         Args:
             other: Context to merge
         
@@ -264,14 +345,14 @@ class Context:
         merged = Context(
             intent=self.intent,
             category=self.category,
-            constraints=deepcopy(self.constraints),
-            routing=deepcopy(self.routing),
-            output=deepcopy(self.output),
-            metadata=deepcopy(self.metadata)
+            constraints=self.constraints.copy(),
+            routing=self.routing.copy(),
+            output=self.output.copy(),
+            metadata=self.metadata.copy()
         )
         
         # Merge inputs
-        merged.inputs = deepcopy(self.inputs) + deepcopy(other.inputs)
+        merged.inputs = self.inputs + other.inputs
         
         # Merge constraints (use most restrictive)
         if other.constraints.get("max_tokens"):
@@ -291,6 +372,19 @@ class Context:
         
         return merged
     
+    def fork_inputs(self) -> "Context":
+        """
+        Replace inputs with deep copies no longer shared with other contexts.
+        
+        extend() and merge() share ContextInput objects between contexts;
+        call this before mutating input data in place.
+        
+        Returns:
+            Self for chaining
+        """
+        self.inputs = deepcopy(self.inputs)
+        return self
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary representation.
@@ -311,14 +405,21 @@ class Context:
             "created_at": self.created_at.isoformat()
         }
     
-    def to_json(self) -> str:
+    def to_json(self, pretty: bool = False) -> str:
         """
         Serialize to JSON string.
         
+        Args:
+            pretty: Indent the output for human reading (compact by default)
+        
         Returns:
             JSON string representation
         """
-        return json.dumps(self.to_dict(), indent=2)
+        # Always the stdlib encoder: orjson formats floats, NaN and non-ASCII
+        # text differently and accepts datetimes, so the output would depend
+        # on whether the "fast" extra is installed
+        encoder = _PRETTY_ENCODER if pretty else _ENCODER
+        return encoder.encode(self.to_dict())
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Context":
@@ -344,12 +445,20 @@ class Context:
         
         # Restore inputs
         if "inputs" in data:
-            ctx.inputs = [ContextInput.from_dict(inp) for inp in data["inputs"]]
+            inputs = data["inputs"]
+            ctx.add_inputs(
+                [inp.get("data") for inp in inputs],
+                relevance=[inp.get("relevance", 1.0) for inp in inputs],
+                tokens=[inp.get("tokens") for inp in inputs]
+            )
         
         # Restore created_at
-        if "created_at" in data:
-            # Handle both timezone-aware and naive ISO format strings
-            created_str = data["created_at"].replace('Z', '+00:00')
+        created_str = data.get("created_at")
+        if created_str:
+            # Handle both timezone-aware and naive ISO format strings; only a
+            # trailing 'Z' (which older fromisoformat rejects) needs rewriting
+            if created_str[-1] == "Z":
+                created_str = created_str[:-1] + "+00:00"
             ctx.created_at = datetime.fromisoformat(created_str)
         
         return ctx
@@ -365,6 +474,18 @@ class Context:
         Returns:
             Context instance
         """
+        # orjson reads integers wider than 64 bits as floats; leave any
+        # document with a long enough digit run to the exact stdlib parser,
+        # as well as bytes input (its encoding is detected by the stdlib)
+        if (orjson is not None
+                and isinstance(json_str, str)
+                and _LONG_DIGITS not in json_str.translate(_DIGITS)):
+            try:
+                return cls.from_dict(orjson.loads(json_str))
+            except orjson.JSONDecodeError:
+                # Fall through so the stdlib parser reports the error, or
+                # accepts its extensions (NaN/Infinity)
+                pass
         return cls.from_dict(json.loads(json_str))
     
     def get_total_tokens(self) -> int:
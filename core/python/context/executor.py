@@ -5,7 +5,15 @@ The Executor handles actual execution of contexts against LLM providers.
 """
 
 import time
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Mapping, Optional
+
+from .router import Router
+
+if TYPE_CHECKING:
+    from .context import Context
+
+_ROUTER = Router()
 
 
 class Executor:
@@ -23,7 +31,8 @@ class Executor:
         self,
         context: "Context",
         request: Dict[str, Any],
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        router: Optional[Router] = None
     ) -> Dict[str, Any]:
         """
         Execute a context with a request.
@@ -32,20 +41,25 @@ class Executor:
             context: Context to execute
             request: Execution request
             api_key: Optional API key (user-provided)
+            router: Router whose model table infers a missing provider
+                (defaults to the base Router)
         
         Returns:
             Execution response
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        # Determine routing
-        routing = context.routing.copy()
-        if request.get("override_routing"):
-            routing.update(request["override_routing"])
+        # Determine routing (only copied when an override must be applied;
+        # provider adapters get a read-only view so they cannot alter the
+        # context's own routing)
+        override = request.get("override_routing")
+        routing = {**context.routing, **override} if override else context.routing
         
-        # Get model and provider
+        # Get model and provider, inferring the provider of known models
         model = routing.get("model", "gpt-3.5-turbo")
-        provider = routing.get("provider", "openai")
+        provider = routing.get("provider")
+        if provider is None:
+            provider = (router or _ROUTER).get_provider(model) or "openai"
         
         # Prepare prompt from inputs
         prompt = self._prepare_prompt(context, request)
@@ -55,11 +69,11 @@ class Executor:
             provider=provider,
             model=model,
             prompt=prompt,
-            routing=routing,
+            routing=MappingProxyType(routing),
             api_key=api_key
         )
         
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         
         # Build response
         response = {
@@ -98,10 +112,8 @@ class Executor:
         if context.inputs:
             parts.append("Context:\n")
             for inp in context.inputs:
-                if isinstance(inp.data, str):
-                    parts.append(inp.data)
-                else:
-                    parts.append(str(inp.data))
+                data = inp.data
+                parts.append(data if type(data) is str else str(data))
                 parts.append("\n")
         
         # Add task
@@ -114,7 +126,7 @@ class Executor:
         provider: str,
         model: str,
         prompt: str,
-        routing: Dict[str, Any],
+        routing: Mapping[str, Any],
         api_key: Optional[str] = None
     ) -> str:
         """
@@ -130,7 +142,8 @@ class Executor:
             provider: Provider identifier
             model: Model identifier
             prompt: Prepared prompt
-            routing: Routing configuration
+            routing: Read-only view of the routing configuration (copy it
+                before adding defaults)
             api_key: Optional API key
         
         Returns:
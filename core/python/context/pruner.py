@@ -4,8 +4,13 @@ Pruner: Input pruning and selection logic.
 The Pruner selects and filters inputs based on relevance scores and token limits.
 """
 
-from typing import List, Optional
-from .context import ContextInput
+from bisect import bisect_right
+from itertools import accumulate
+from operator import attrgetter
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from .context import ContextInput
 
 
 class Pruner:
@@ -18,17 +23,17 @@ class Pruner:
     
     def prune(
         self,
-        inputs: List[ContextInput],
+        inputs: List["ContextInput"],
         max_tokens: Optional[int] = None,
         relevance_threshold: float = 0.0
-    ) -> List[ContextInput]:
+    ) -> List["ContextInput"]:
         """
         Prune inputs to fit constraints.
         
         Strategy:
         1. Filter by relevance threshold
         2. Sort by relevance (descending)
-        3. Take inputs until token limit is reached
+        3. Take inputs until the running token total exceeds the limit
         
         Args:
             inputs: List of context inputs
@@ -38,45 +43,49 @@ class Pruner:
         Returns:
             Pruned list of inputs
         """
-        # Filter by relevance threshold
-        filtered = [
-            inp for inp in inputs
-            if inp.relevance >= relevance_threshold
-        ]
+        if not inputs:
+            return []
+        
+        # Without a token limit there is no cutoff to locate, so skip the
+        # column bookkeeping and sort the surviving inputs directly
+        if max_tokens is None:
+            return sorted(
+                (inp for inp in inputs if inp.relevance >= relevance_threshold),
+                key=attrgetter("relevance"),
+                reverse=True
+            )
         
-        # Sort by relevance (descending)
-        sorted_inputs = sorted(
-            filtered,
-            key=lambda x: x.relevance,
+        # Gather the fields the pruner touches into parallel columns so the
+        # filter and sort work on plain lists instead of input attributes
+        relevance = [inp.relevance for inp in inputs]
+        tokens = [inp.tokens for inp in inputs]
+        
+        # Filter by relevance threshold, then sort indices by relevance
+        # (descending, stable for equal scores)
+        order = sorted(
+            (i for i, rel in enumerate(relevance) if rel >= relevance_threshold),
+            key=relevance.__getitem__,
             reverse=True
         )
         
-        # If no token limit, return all
-        if max_tokens is None:
-            return sorted_inputs
-        
-        # Take inputs until token limit
-        pruned = []
-        total_tokens = 0
+        # Running token totals are non-decreasing, so the number of inputs
+        # that fit is the insertion point of the limit
+        cumulative = list(accumulate(tokens[i] for i in order))
+        cut = bisect_right(cumulative, max_tokens)
+        pruned = [inputs[i] for i in order[:cut]]
         
-        for inp in sorted_inputs:
-            if total_tokens + inp.tokens <= max_tokens:
-                pruned.append(inp)
-                total_tokens += inp.tokens
-            else:
-                # Try to fit partial input if it's text
-                if isinstance(inp.data, str):
-                    remaining_tokens = max_tokens - total_tokens
-                    if remaining_tokens > 100:  # Only if meaningful space left
-                        # Rough character estimate
-                        chars_to_keep = remaining_tokens * 4
-                        truncated_data = inp.data[:chars_to_keep]
-                        truncated_input = ContextInput(
-                            data=truncated_data,
-                            relevance=inp.relevance,
-                            tokens=remaining_tokens
-                        )
-                        pruned.append(truncated_input)
-                break
+        # Try to fit partial input if the first rejected one is text and
+        # meaningful space is left
+        if cut < len(order):
+            remaining_tokens = max_tokens - (cumulative[cut - 1] if cut else 0)
+            inp = inputs[order[cut]]
+            if remaining_tokens > 100 and isinstance(inp.data, str):
+                # Rough character estimate (4 chars per token); the explicit
+                # token count spares the new input its own estimation
+                pruned.append(type(inp)(
+                    data=inp.data[:remaining_tokens << 2],
+                    relevance=inp.relevance,
+                    tokens=remaining_tokens
+                ))
         
         return pruned
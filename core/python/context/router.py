@@ -5,7 +5,42 @@ The Router selects appropriate models and providers based on context constraints
 and strategies.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+
+def _derive_tables(
+    model_specs: Dict[str, Dict[str, Any]]
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Precompute strategy and provider lookups from model specifications.
+    
+    Args:
+        model_specs: Model specifications keyed by model identifier
+    
+    Returns:
+        (strategy -> model, model -> provider) tables
+    """
+    strategy_table = {
+        # Select cheapest model
+        "cost_optimized": min(
+            model_specs,
+            key=lambda m: model_specs[m]["cost_per_1k_input"]
+        ),
+        # Select highest quality model
+        "quality_optimized": max(
+            model_specs,
+            key=lambda m: model_specs[m]["quality"]
+        ),
+        # Select fastest model
+        "speed_optimized": max(
+            model_specs,
+            key=lambda m: model_specs[m]["speed"]
+        )
+    }
+    model_to_provider = {
+        model: spec["provider"] for model, spec in model_specs.items()
+    }
+    return strategy_table, model_to_provider
 
 
 class Router:
@@ -55,6 +90,39 @@ class Router:
         }
     }
     
+    # Strategy answers and providers are derived from MODEL_SPECS up front;
+    # add models through register_model() so the tables stay in step
+    _STRATEGY_TABLE, _MODEL_TO_PROVIDER = _derive_tables(MODEL_SPECS)
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses supplying their own specs get their own tables
+        if "MODEL_SPECS" in cls.__dict__:
+            cls._STRATEGY_TABLE, cls._MODEL_TO_PROVIDER = _derive_tables(
+                cls.MODEL_SPECS
+            )
+    
+    @classmethod
+    def register_model(cls, model: str, spec: Dict[str, Any]) -> None:
+        """
+        Add or replace a model specification.
+        
+        Editing MODEL_SPECS directly is not picked up by routing, which reads
+        the derived tables; this rebuilds them for the class.
+        
+        Args:
+            model: Model identifier
+            spec: Model specifications (provider, max_tokens, costs, quality,
+                speed)
+        """
+        # Registering on a subclass must not change the inherited specs
+        if "MODEL_SPECS" not in cls.__dict__:
+            cls.MODEL_SPECS = dict(cls.MODEL_SPECS)
+        cls.MODEL_SPECS[model] = spec
+        cls._STRATEGY_TABLE, cls._MODEL_TO_PROVIDER = _derive_tables(
+            cls.MODEL_SPECS
+        )
+    
     def route(
         self,
         current_routing: Dict[str, Any],
@@ -79,8 +147,8 @@ class Router:
         # Explicit model takes precedence
         if model:
             routing["model"] = model
-            if model in self.MODEL_SPECS:
-                routing["provider"] = self.MODEL_SPECS[model]["provider"]
+            if model in self._MODEL_TO_PROVIDER:
+                routing["provider"] = self._MODEL_TO_PROVIDER[model]
         
         # Explicit provider
         if provider:
@@ -89,8 +157,8 @@ class Router:
         # Apply strategy
         if strategy and "model" not in routing:
             routing["model"] = self._select_by_strategy(strategy)
-            if routing["model"] in self.MODEL_SPECS:
-                routing["provider"] = self.MODEL_SPECS[routing["model"]]["provider"]
+            if routing["model"] in self._MODEL_TO_PROVIDER:
+                routing["provider"] = self._MODEL_TO_PROVIDER[routing["model"]]
         
         return routing
     
@@ -104,27 +172,20 @@ class Router:
         Returns:
             Model identifier
         """
-        if strategy == "cost_optimized":
-            # Select cheapest model
-            return min(
-                self.MODEL_SPECS.keys(),
-                key=lambda m: self.MODEL_SPECS[m]["cost_per_1k_input"]
-            )
-        elif strategy == "quality_optimized":
-            # Select highest quality model
-            return max(
-                self.MODEL_SPECS.keys(),
-                key=lambda m: self.MODEL_SPECS[m]["quality"]
-            )
-        elif strategy == "speed_optimized":
-            # Select fastest model
-            return max(
-                self.MODEL_SPECS.keys(),
-                key=lambda m: self.MODEL_SPECS[m]["speed"]
-            )
-        else:
-            # Default to balanced model
-            return "gpt-3.5-turbo"
+        # Default to balanced model
+        return self._STRATEGY_TABLE.get(strategy, "gpt-3.5-turbo")
+    
+    def get_provider(self, model: str) -> Optional[str]:
+        """
+        Get the provider serving a model.
+        
+        Args:
+            model: Model identifier
+        
+        Returns:
+            Provider identifier, or None for unknown models
+        """
+        return self._MODEL_TO_PROVIDER.get(model)
     
     def get_model_spec(self, model: str) -> Dict[str, Any]:
         """
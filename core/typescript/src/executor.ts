@@ -5,6 +5,7 @@
  */
 
 import { Context } from './context';
+import { Router } from './router';
 
 export interface ExecutionRequest {
   task: string;
@@ -38,9 +39,10 @@ export class Executor {
       Object.assign(routing, request.overrideRouting);
     }
 
-    // Get model and provider
+    // Get model and provider, inferring the provider of known models
     const model = routing.model || 'gpt-3.5-turbo';
-    const provider = routing.provider || 'openai';
+    const provider =
+      routing.provider || Router.MODEL_SPECS[model]?.provider || 'openai';
 
     // Prepare prompt from inputs
     const prompt = this.preparePrompt(context, request);
@@ -16,7 +16,7 @@ interface ModelSpec {
 
 export class Router {
   // Model capabilities and costs (example data)
-  private static readonly MODEL_SPECS: Record<string, ModelSpec> = {
+  static readonly MODEL_SPECS: Record<string, ModelSpec> = {
     'gpt-4': {
       provider: 'openai',
       maxTokens: 8192,
@@ -56,6 +56,9 @@ def analyze_catalog():
         }
     ]
     
+    # One timestamp for the whole run, reused by the saved context and results
+    analysis_date = datetime.now().isoformat()
+    
     # Create context for analysis
     ctx = Context(
         intent="analyze_catalog",
@@ -68,30 +71,32 @@ def analyze_catalog():
             "strategy": "cost_optimized"
         },
         metadata={
-            "analysis_date": datetime.now().isoformat(),
+            "analysis_date": analysis_date,
             "catalog_size": len(catalog)
         }
     )
     
     # Add catalog items with relevance based on checkout count
+    # (0.3 to 1.0 based on popularity), in a single batch
     max_checkouts = max(item["checkouts"] for item in catalog)
+    relevances = [
+        0.3 + (0.7 * item["checkouts"] / max_checkouts)
+        for item in catalog
+    ]
+    ctx.add_inputs(catalog, relevance=relevances)
     
-    for item in catalog:
-        # Calculate relevance (0.3 to 1.0 based on popularity)
-        relevance = 0.3 + (0.7 * item["checkouts"] / max_checkouts)
-        ctx.add_input(item, relevance=relevance)
-    
+    total_tokens = ctx.get_total_tokens()
     print(f"Created context with {len(ctx.inputs)} inputs")
-    print(f"Total tokens: {ctx.get_total_tokens()}")
+    print(f"Total tokens: {total_tokens}")
     
     # Prune if needed
-    if ctx.get_total_tokens() > ctx.constraints.get("max_tokens", 4000):
+    if total_tokens > ctx.constraints.get("max_tokens", 4000):
         ctx.prune()
         print(f"Pruned to {len(ctx.inputs)} inputs, {ctx.get_total_tokens()} tokens")
     
     # Save context for reproducibility
     with open("analysis_context.json", "w") as f:
-        f.write(ctx.to_json())
+        f.write(ctx.to_json(pretty=True))
     print("Saved context to analysis_context.json")
     
     # Execute analysis (stub - would need API key in real usage)
@@ -107,14 +112,14 @@ def analyze_catalog():
             "analysis_metadata": {
                 "context_id": result["context_id"],
                 "model": result["model_used"],
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": analysis_date,
                 "input_items": result["metadata"]["input_count"]
             },
             "insights": result["result"]
         }
         
         with open("analysis_results.json", "w") as f:
-            json.dump(output, f, indent=2)
+            f.write(json.dumps(output, indent=2))
         
         print("\nAnalysis Results:")
         print(f"Model used: {result['model_used']}")
@@ -100,8 +100,12 @@ def execute_backend_analysis(ctx):
     return result
 
 
-def save_for_frontend(ctx, analysis_result):
-    """Save context and results for frontend."""
+def save_for_frontend(ctx, analysis_result, pretty=False):
+    """Save context and results for frontend.
+    
+    The file is machine-read by the frontend, so it is written compactly
+    unless ``pretty`` is set for human inspection.
+    """
     print("\n=== Backend: Saving for Frontend ===\n")
     
     # Save context (can be loaded by frontend)
@@ -115,7 +119,10 @@ def save_for_frontend(ctx, analysis_result):
     }
     
     with open("shared_context.json", "w") as f:
-        json.dump(context_data, f, indent=2)
+        if pretty:
+            json.dump(context_data, f, indent=2)
+        else:
+            json.dump(context_data, f, separators=(",", ":"))
     
     print("Saved context to shared_context.json")
     print("\nFrontend can now:")